@@ -8,7 +8,6 @@ import math
 
 import numpy as np
 import pandas as pd
-import scipy as sp
 from shapely.geometry import LineString, Point, Polygon
 from tqdm import tqdm
 
@@ -141,27 +140,28 @@ class Volume:
     def __init__(self, gdf, heights, areas=None):
         self.gdf = gdf
 
-        gdf = gdf.copy()
-        if not isinstance(heights, str):
-            gdf["mm_h"] = heights
-            heights = "mm_h"
-        self.heights = gdf[heights]
-
-        if areas is not None:
-            if not isinstance(areas, str):
-                gdf["mm_a"] = areas
-                areas = "mm_a"
-            self.areas = gdf[areas]
-        else:
-            self.areas = gdf.geometry.area
         try:
-            self.series = self.areas * self.heights
+            if isinstance(heights, str):
+                heights = gdf[heights]
+            else:
+                heights = pd.Series(heights, index=gdf.index)
 
+            if areas is None:
+                areas = gdf.geometry.area
+            elif isinstance(areas, str):
+                areas = gdf[areas]
+            else:
+                areas = pd.Series(areas, index=gdf.index)
         except KeyError:
             raise KeyError(
                 "ERROR: Column not found. Define heights and areas or set areas to None."
             )
 
+        self.heights = heights
+        self.areas = areas
+
+        self.series = self.areas * self.heights
+
 
 class FloorArea:
     """
@@ -210,27 +210,28 @@ class FloorArea:
     def __init__(self, gdf, heights, areas=None):
         self.gdf = gdf
 
-        gdf = gdf.copy()
-        if not isinstance(heights, str):
-            gdf["mm_h"] = heights
-            heights = "mm_h"
-        self.heights = gdf[heights]
-
-        if areas is not None:
-            if not isinstance(areas, str):
-                gdf["mm_a"] = areas
-                areas = "mm_a"
-            self.areas = gdf[areas]
-        else:
-            self.areas = gdf.geometry.area
         try:
-            self.series = self.areas * (self.heights // 3)
+            if isinstance(heights, str):
+                heights = gdf[heights]
+            else:
+                heights = pd.Series(heights, index=gdf.index)
 
+            if areas is None:
+                areas = gdf.geometry.area
+            elif isinstance(areas, str):
+                areas = gdf[areas]
+            else:
+                areas = pd.Series(areas, index=gdf.index)
         except KeyError:
             raise KeyError(
                 "ERROR: Column not found. Define heights and areas or set areas to None."
             )
 
+        self.heights = heights
+        self.areas = areas
+
+        self.series = self.areas * (self.heights // 3)
+
 
 class CourtyardArea:
     """
@@ -267,18 +268,17 @@ class CourtyardArea:
     def __init__(self, gdf, areas=None):
         self.gdf = gdf
 
-        gdf = gdf.copy()
         if areas is None:
             areas = gdf.geometry.area
+        elif isinstance(areas, str):
+            areas = gdf[areas]
+        else:
+            areas = pd.Series(areas, index=gdf.index)
+        self.areas = areas
 
-        if not isinstance(areas, str):
-            gdf["mm_a"] = areas
-            areas = "mm_a"
-        self.areas = gdf[areas]
-
-        exts = gdf.geometry.apply(lambda g: Polygon(g.exterior))
+        exts = [Polygon(g.exterior).area for g in gdf.geometry.values]
 
-        self.series = pd.Series(exts.area - gdf[areas], index=gdf.index)
+        self.series = pd.Series(exts, index=gdf.index) - self.areas
 
 
 # calculate the radius of circumcircle
@@ -320,7 +320,10 @@ class LongestAxisLength:
     def __init__(self, gdf):
         self.gdf = gdf
         hulls = gdf.geometry.convex_hull
-        self.series = hulls.apply(lambda hull: _longest_axis(hull.exterior.coords))
+        self.series = pd.Series(
+            [_longest_axis(np.asarray(hull.exterior.coords)) for hull in hulls.values],
+            index=gdf.index,
+        )
 
 
 class AverageCharacter:
@@ -352,6 +355,8 @@ class AverageCharacter:
     mode : str (default 'all')
         mode of average calculation. Can be set to `all`, `mean`, `median` or `mode` or
         list of any of the options.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -386,7 +391,16 @@ class AverageCharacter:
     4823.1334436678835
     """
 
-    def __init__(self, gdf, values, spatial_weights, unique_id, rng=None, mode="all"):
+    def __init__(
+        self,
+        gdf,
+        values,
+        spatial_weights,
+        unique_id,
+        rng=None,
+        mode="all",
+        verbose=True,
+    ):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
@@ -422,7 +436,10 @@ class AverageCharacter:
                 raise ValueError("{} is not supported as mode.".format(mode))
             mode = [mode]
 
-        for index in tqdm(data.index, total=data.shape[0]):
+        if "mode" in mode:
+            from scipy import stats
+
+        for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
@@ -439,7 +456,7 @@ class AverageCharacter:
                 if "median" in mode:
                     medians.append(np.median(values_list))
                 if "mode" in mode:
-                    modes.append(sp.stats.mode(values_list)[0][0])
+                    modes.append(stats.mode(values_list)[0][0])
 
             else:
                 if "mean" in mode:
@@ -482,6 +499,8 @@ class StreetProfile:
         distance between perpendicular ticks
     tick_length : int (default 50)
         length of ticks
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -516,7 +535,9 @@ class StreetProfile:
     >>> streets_df['deviations'] = street_profile.wd
     """
 
-    def __init__(self, left, right, heights=None, distance=10, tick_length=50):
+    def __init__(
+        self, left, right, heights=None, distance=10, tick_length=50, verbose=True
+    ):
         self.left = left
         self.right = right
         self.distance = distance
@@ -529,8 +550,12 @@ class StreetProfile:
                 heights = "mm_h"
 
             self.heights = right[heights]
+            rheights = self.heights.values
 
         sindex = right.sindex
+        # fetch the arrays once instead of dispatching through the frame per tick
+        rgeoms = right.geometry.values
+        rexteriors = right.geometry.exterior.values
 
         results_list = []
         deviations_list = []
@@ -538,13 +563,15 @@ class StreetProfile:
         heights_deviations_list = []
         openness_list = []
 
-        for idx, row in tqdm(left.iterrows(), total=left.shape[0]):
+        for geom in tqdm(
+            left.geometry.values, total=left.shape[0], disable=not verbose
+        ):
             # list to hold all the point coords
             list_points = []
             # set the current distance to place the point
             current_dist = distance
             # make shapely MultiLineString object
-            shapely_line = row.geometry
+            shapely_line = geom
             # get the total length of the line
             line_length = shapely_line.length
             # append the starting coordinate to the list
@@ -611,18 +638,18 @@ class StreetProfile:
                     possible_intersections_index = list(
                         sindex.intersection(tick.bounds)
                     )
-                    possible_intersections = right.iloc[possible_intersections_index]
-                    real_intersections = possible_intersections.intersects(tick)
-                    get_height = right.loc[list(real_intersections.index)]
-                    possible_int = get_height.exterior.intersection(tick)
+                    possible_int = [
+                        rexteriors[pi].intersection(tick)
+                        for pi in possible_intersections_index
+                    ]
 
-                    if not possible_int.is_empty.all():
+                    if not all(inter.is_empty for inter in possible_int):
                         true_int = []
-                        for one in list(possible_int.index):
-                            if possible_int[one].type == "Point":
-                                true_int.append(possible_int[one])
-                            elif possible_int[one].type == "MultiPoint":
-                                for p in possible_int[one]:
+                        for inter in possible_int:
+                            if inter.type == "Point":
+                                true_int.append(inter)
+                            elif inter.type == "MultiPoint":
+                                for p in inter:
                                     true_int.append(p)
 
                         if len(true_int) > 1:
@@ -648,11 +675,11 @@ class StreetProfile:
                                 )
                         if heights is not None:
                             indices = {}
-                            for idx, row in get_height.iterrows():
-                                dist = row.geometry.distance(Point(tick.coords[-1]))
-                                indices[idx] = dist
+                            for pi in possible_intersections_index:
+                                dist = rgeoms[pi].distance(Point(tick.coords[-1]))
+                                indices[pi] = dist
                             minim = min(indices, key=indices.get)
-                            m_heights.append(right.loc[minim][heights])
+                            m_heights.append(rheights[minim])
 
             openness = (len(lefts) + len(rights)) / len(ticks * 2)
             openness_list.append(1 - openness)
@@ -735,7 +762,8 @@ class WeightedCharacter:
         name of the column with unique id used as ``spatial_weights`` index.
     areas : str, list, np.array, pd.Series (default None)
         the name of the left dataframe column, ``np.array``, or ``pd.Series`` where is stored area value
-
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -757,10 +785,11 @@ class WeightedCharacter:
     >>> sw = libpysal.weights.DistanceBand.from_dataframe(tessellation_df, threshold=100, silence_warnings=True)
     >>> buildings_df['w_height_100'] = momepy.WeightedCharacter(buildings_df, values='height', spatial_weights=sw,
                                                                  unique_id='uID').series
-    100%|██████████| 144/144 [00:00<00:00, 361.60it/s]
     """
 
-    def __init__(self, gdf, values, spatial_weights, unique_id, areas=None):
+    def __init__(
+        self, gdf, values, spatial_weights, unique_id, areas=None, verbose=True
+    ):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
@@ -781,23 +810,40 @@ class WeightedCharacter:
 
         data = data.set_index(unique_id)[[values, areas]]
 
-        results_list = []
-        for index in tqdm(data.index, total=data.shape[0]):
-            if index in spatial_weights.neighbors.keys():
-                neighbours = spatial_weights.neighbors[index].copy()
-                if neighbours:
-                    neighbours.append(index)
+        if hasattr(spatial_weights, "sparse"):
+            # weighted sums of neighbours and self via the sparse matrix, binarized
+            # so weight values do not scale the contributions
+            binary = spatial_weights.sparse != 0
+            ordered = data.loc[spatial_weights.id_order]
+            vals = ordered[values].values
+            ars = ordered[areas].values
+            weighted = vals * ars
+            numerator = binary.dot(weighted) + weighted
+            denominator = binary.dot(ars) + ars
+            results = pd.Series(
+                numerator / denominator, index=spatial_weights.id_order
+            ).reindex(self.id)
+
+            self.series = pd.Series(results.values, index=gdf.index)
+        else:
+            # on-demand weights (momepy.DistanceBand) only expose .neighbors
+            results_list = []
+            for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
+                if index in spatial_weights.neighbors.keys():
+                    neighbours = spatial_weights.neighbors[index].copy()
+                    if neighbours:
+                        neighbours.append(index)
+                    else:
+                        neighbours = [index]
+
+                    subset = data.loc[neighbours]
+                    results_list.append(
+                        (sum(subset[values] * subset[areas])) / (sum(subset[areas]))
+                    )
                 else:
-                    neighbours = [index]
+                    results_list.append(np.nan)
 
-                subset = data.loc[neighbours]
-                results_list.append(
-                    (sum(subset[values] * subset[areas])) / (sum(subset[areas]))
-                )
-            else:
-                results_list.append(np.nan)
-
-        self.series = pd.Series(results_list, index=gdf.index)
+            self.series = pd.Series(results_list, index=gdf.index)
 
 
 class CoveredArea:
@@ -817,6 +863,8 @@ class CoveredArea:
         spatial weights matrix
     unique_id : str
         name of the column with unique id used as ``spatial_weights`` index.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -833,33 +881,42 @@ class CoveredArea:
     --------
     >>> sw = momepy.sw_high(k=3, gdf=tessellation_df, ids='uID')
     >>> tessellation_df['covered3steps'] = mm.CoveredArea(tessellation_df, sw, 'uID').series
-    100%|██████████| 144/144 [00:00<00:00, 549.15it/s]
 
     """
 
-    def __init__(self, gdf, spatial_weights, unique_id):
+    def __init__(self, gdf, spatial_weights, unique_id, verbose=True):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
 
-        data = gdf
-        area = data.set_index(unique_id).geometry.area
+        area = gdf.set_index(unique_id).geometry.area
 
-        results_list = []
-        for index in tqdm(area.index, total=area.shape[0]):
-            if index in spatial_weights.neighbors.keys():
-                neighbours = spatial_weights.neighbors[index].copy()
-                if neighbours:
-                    neighbours.append(index)
-                else:
-                    neighbours = [index]
+        if hasattr(spatial_weights, "sparse"):
+            # sum areas of neighbours and self in one sparse matrix multiplication,
+            # binarized so weight values do not scale the contributions
+            binary = spatial_weights.sparse != 0
+            ordered = area.loc[spatial_weights.id_order].values
+            summed = binary.dot(ordered) + ordered
+            results = pd.Series(summed, index=spatial_weights.id_order).reindex(self.id)
 
-                areas = area.loc[neighbours]
-                results_list.append(sum(areas))
-            else:
-                results_list.append(np.nan)
+            self.series = pd.Series(results.values, index=gdf.index)
+        else:
+            # on-demand weights (momepy.DistanceBand) only expose .neighbors
+            results_list = []
+            for index in tqdm(area.index, total=area.shape[0], disable=not verbose):
+                if index in spatial_weights.neighbors.keys():
+                    neighbours = spatial_weights.neighbors[index].copy()
+                    if neighbours:
+                        neighbours.append(index)
+                    else:
+                        neighbours = [index]
+
+                    areas = area.loc[neighbours]
+                    results_list.append(sum(areas))
+                else:
+                    results_list.append(np.nan)
 
-        self.series = pd.Series(results_list, index=gdf.index)
+            self.series = pd.Series(results_list, index=gdf.index)
 
 
 class PerimeterWall:
@@ -873,6 +930,8 @@ class PerimeterWall:
     spatial_weights : libpysal.weights, optional
         spatial weights matrix - If None, Queen contiguity matrix will be calculated
         based on gdf. It is to denote adjacent buildings (note: based on index, not ID).
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -895,15 +954,17 @@ class PerimeterWall:
     It might take a while to compute this character.
     """
 
-    def __init__(self, gdf, spatial_weights=None):
+    def __init__(self, gdf, spatial_weights=None, verbose=True):
         self.gdf = gdf
 
         if spatial_weights is None:
-            print("Calculating spatial weights...")
+            if verbose:
+                print("Calculating spatial weights...")
             from libpysal.weights import Queen
 
             spatial_weights = Queen.from_dataframe(gdf, silence_warnings=True)
-            print("Spatial weights ready...")
+            if verbose:
+                print("Spatial weights ready...")
         self.sw = spatial_weights
 
         # dict to store walls for each uID
@@ -911,7 +972,7 @@ class PerimeterWall:
         components = pd.Series(spatial_weights.component_labels, index=range(len(gdf)))
         geom = gdf.geometry
 
-        for i in tqdm(range(gdf.shape[0]), total=gdf.shape[0]):
+        for i in tqdm(range(gdf.shape[0]), total=gdf.shape[0], disable=not verbose):
             # if the id is already present in walls, continue (avoid repetition)
             if i in walls:
                 continue
@@ -926,7 +987,7 @@ class PerimeterWall:
                     walls[b] = dissolved.exterior.length
 
         results_list = []
-        for i in tqdm(range(gdf.shape[0]), total=gdf.shape[0]):
+        for i in tqdm(range(gdf.shape[0]), total=gdf.shape[0], disable=not verbose):
             results_list.append(walls[i])
         self.series = pd.Series(results_list, index=gdf.index)
 
@@ -949,6 +1010,8 @@ class SegmentsLength:
     mean : boolean, optional
         If mean=False it will compute sum of length, if mean=True it will compute
         sum and mean
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -970,22 +1033,24 @@ class SegmentsLength:
     Spatial weights ready...
     """
 
-    def __init__(self, gdf, spatial_weights=None, mean=False):
+    def __init__(self, gdf, spatial_weights=None, mean=False, verbose=True):
         self.gdf = gdf
 
         if spatial_weights is None:
-            print("Calculating spatial weights...")
+            if verbose:
+                print("Calculating spatial weights...")
             from libpysal.weights import Queen
 
             spatial_weights = Queen.from_dataframe(gdf, silence_warnings=True)
-            print("Spatial weights ready...")
+            if verbose:
+                print("Spatial weights ready...")
         self.sw = spatial_weights
 
         lenghts = gdf.geometry.length
 
         sums = []
         means = []
-        for index in tqdm(gdf.index, total=gdf.shape[0]):
+        for index in tqdm(gdf.index, total=gdf.shape[0], disable=not verbose):
             neighbours = spatial_weights.neighbors[index].copy()
             if neighbours:
                 neighbours.append(index)
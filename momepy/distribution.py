@@ -43,6 +43,8 @@ class Orientation:
     ----------
     gdf : GeoDataFrame
         GeoDataFrame containing objects to analyse
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -59,7 +61,7 @@ class Orientation:
     41.05146788287027
     """
 
-    def __init__(self, gdf):
+    def __init__(self, gdf, verbose=True):
         self.gdf = gdf
         # define empty list for results
         results_list = []
@@ -67,7 +69,7 @@ class Orientation:
         def _dist(a, b):
             return math.hypot(b[0] - a[0], b[1] - a[1])
 
-        for geom in tqdm(gdf.geometry, total=gdf.shape[0]):
+        for geom in tqdm(gdf.geometry.values, total=gdf.shape[0], disable=not verbose):
             if geom.type in ["Polygon", "MultiPolygon", "LinearRing"]:
                 # TODO: vectorize once minimum_rotated_rectangle is in geopandas from pygeos
                 bbox = list(geom.minimum_rotated_rectangle.exterior.coords)
@@ -124,6 +126,8 @@ class SharedWallsRatio:
         the name of the dataframe column, ``np.array``, or ``pd.Series`` with unique id
     perimeters : str, list, np.array, pd.Series (default None)
         the name of the dataframe column, ``np.array``, or ``pd.Series`` where is stored perimeter value
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -146,7 +150,7 @@ class SharedWallsRatio:
     0.3424804411228673
     """
 
-    def __init__(self, gdf, unique_id, perimeters=None):
+    def __init__(self, gdf, unique_id, perimeters=None, verbose=True):
         self.gdf = gdf
 
         gdf = gdf.copy()
@@ -175,6 +179,7 @@ class SharedWallsRatio:
                 gdf[[perimeters, "_bounds", gdf._geometry_column_name]].itertuples()
             ),
             total=gdf.shape[0],
+            disable=not verbose,
         ):
             neighbors = list(self.sindex.intersection(row[2]))
             neighbors.remove(i)
@@ -404,6 +409,8 @@ class Alignment:
         (can be calculated using :class:`momepy.Orientation`)
     unique_id : str
         name of the column with unique id used as ``spatial_weights`` index.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -426,7 +433,7 @@ class Alignment:
     18.299481296455237
     """
 
-    def __init__(self, gdf, spatial_weights, unique_id, orientations):
+    def __init__(self, gdf, spatial_weights, unique_id, orientations, verbose=True):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
@@ -442,7 +449,9 @@ class Alignment:
         data = gdf.set_index(unique_id)[orientations]
 
         # iterating over rows one by one
-        for index, orient in tqdm(data.iteritems(), total=data.shape[0]):
+        for index, orient in tqdm(
+            data.iteritems(), total=data.shape[0], disable=not verbose
+        ):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
@@ -477,6 +486,8 @@ class NeighborDistance:
         spatial weights matrix based on unique_id
     unique_id : str
         name of the column with unique id used as ``spatial_weights`` index.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -497,7 +508,7 @@ class NeighborDistance:
     29.18589019096464
     """
 
-    def __init__(self, gdf, spatial_weights, unique_id):
+    def __init__(self, gdf, spatial_weights, unique_id, verbose=True):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
@@ -507,7 +518,9 @@ class NeighborDistance:
         data = gdf.set_index(unique_id).geometry
 
         # iterating over rows one by one
-        for index, geom in tqdm(data.iteritems(), total=data.shape[0]):
+        for index, geom in tqdm(
+            data.iteritems(), total=data.shape[0], disable=not verbose
+        ):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index]
                 building_neighbours = data.loc[neighbours]
@@ -546,6 +559,8 @@ class MeanInterbuildingDistance:
         based on ``spatial_weights``
     order : int
         Order of Queen contiguity
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -580,18 +595,24 @@ class MeanInterbuildingDistance:
     """
 
     def __init__(
-        self, gdf, spatial_weights, unique_id, spatial_weights_higher=None, order=3
+        self,
+        gdf,
+        spatial_weights,
+        unique_id,
+        spatial_weights_higher=None,
+        order=3,
+        verbose=True,
     ):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
 
         if spatial_weights_higher is None:
-            print(
-                "Generating weights matrix (Queen) of {} topological steps...".format(
-                    order
+            if verbose:
+                print(
+                    "Generating weights matrix (Queen) of"
+                    " {} topological steps...".format(order)
                 )
-            )
             self.order = order
             from momepy import sw_high
 
@@ -604,14 +625,18 @@ class MeanInterbuildingDistance:
         # define empty list for results
         results_list = []
 
-        print("Generating adjacency matrix based on weights matrix...")
+        if verbose:
+            print("Generating adjacency matrix based on weights matrix...")
         # define adjacency list from lipysal
         adj_list = spatial_weights.to_adjlist()
         adj_list["distance"] = -1
 
-        print("Computing interbuilding distances...")
+        if verbose:
+            print("Computing interbuilding distances...")
         # measure each interbuilding distance of neighbours and save them to adjacency list
-        for row in tqdm(adj_list.itertuples(), total=adj_list.shape[0]):
+        for row in tqdm(
+            adj_list.itertuples(), total=adj_list.shape[0], disable=not verbose
+        ):
             inverted = adj_list[(adj_list.focal == row.neighbor)][
                 (adj_list.neighbor == row.focal)
             ].iloc[0]["distance"]
@@ -625,9 +650,10 @@ class MeanInterbuildingDistance:
             else:
                 adj_list.at[row.Index, "distance"] = inverted
 
-        print("Computing mean interbuilding distances...")
+        if verbose:
+            print("Computing mean interbuilding distances...")
         # iterate over objects to get the final values
-        for uid in tqdm(data.index, total=data.shape[0]):
+        for uid in tqdm(data.index, total=data.shape[0], disable=not verbose):
             # define neighbours based on weights matrix defining analysis area
             if uid in spatial_weights_higher.neighbors.keys():
                 neighbours = spatial_weights_higher.neighbors[uid].copy()
@@ -657,6 +683,8 @@ class NeighboringStreetOrientationDeviation:
     ----------
     gdf : GeoDataFrame
         GeoDataFrame containing street network to analyse
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -679,15 +707,16 @@ class NeighboringStreetOrientationDeviation:
     7.043096518688273
     """
 
-    def __init__(self, gdf):
+    def __init__(self, gdf, verbose=True):
         self.gdf = gdf
 
         results_list = []
         gdf = gdf.copy()
 
         # iterating over rows one by one
-        print(" Preparing street orientations...")
-        for geom in tqdm(gdf.geometry, total=gdf.shape[0]):
+        if verbose:
+            print(" Preparing street orientations...")
+        for geom in tqdm(gdf.geometry.values, total=gdf.shape[0], disable=not verbose):
 
             start = geom.coords[0]
             end = geom.coords[-1]
@@ -712,11 +741,12 @@ class NeighboringStreetOrientationDeviation:
 
         gdf["tmporient"] = self.orientation
 
-        print(" Generating spatial index...")
+        if verbose:
+            print(" Generating spatial index...")
         self.sindex = gdf.sindex
         results_list = []
 
-        for row in tqdm(gdf.itertuples(), total=gdf.shape[0]):
+        for row in tqdm(gdf.itertuples(), total=gdf.shape[0], disable=not verbose):
             possible_neighbors_idx = list(self.sindex.intersection(row.geometry.bounds))
             possible_neighbours = gdf.iloc[possible_neighbors_idx]
             neighbors = possible_neighbours[
@@ -755,6 +785,8 @@ class BuildingAdjacency:
     spatial_weights : libpysal.weights, optional
         spatial weights matrix - If None, Queen contiguity matrix will be calculated
         based on gdf. It is to denote adjacent buildings (note: based on unique ID).
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -781,7 +813,9 @@ class BuildingAdjacency:
     0.23809523809523808
     """
 
-    def __init__(self, gdf, spatial_weights_higher, unique_id, spatial_weights=None):
+    def __init__(
+        self, gdf, spatial_weights_higher, unique_id, spatial_weights=None, verbose=True
+    ):
         self.gdf = gdf
         self.sw_higher = spatial_weights_higher
         self.id = gdf[unique_id]
@@ -789,19 +823,22 @@ class BuildingAdjacency:
 
         # if weights matrix is not passed, generate it from gdf
         if spatial_weights is None:
-            print("Calculating spatial weights...")
+            if verbose:
+                print("Calculating spatial weights...")
             from libpysal.weights import Queen
 
             spatial_weights = Queen.from_dataframe(
                 gdf, silence_warnings=True, ids=unique_id
             )
-            print("Spatial weights ready...")
+            if verbose:
+                print("Spatial weights ready...")
 
         self.sw = spatial_weights
         patches = dict(zip(gdf[unique_id], spatial_weights.component_labels))
 
-        print("Calculating adjacency...")
-        for uid in tqdm(self.id, total=gdf.shape[0]):
+        if verbose:
+            print("Calculating adjacency...")
+        for uid in tqdm(self.id, total=gdf.shape[0], disable=not verbose):
             if uid in spatial_weights_higher.neighbors.keys():
                 neighbours = spatial_weights_higher.neighbors[uid].copy()
                 if neighbours:
@@ -839,6 +876,8 @@ class Neighbors:
         name of the column with unique id used as ``spatial_weights`` index
     weighted : bool (default False)
         if ``True``, number of neighbours will be divided by the perimeter of object, to return relative value
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -864,7 +903,7 @@ class Neighbors:
     4
     """
 
-    def __init__(self, gdf, spatial_weights, unique_id, weighted=False):
+    def __init__(self, gdf, spatial_weights, unique_id, weighted=False, verbose=True):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
@@ -872,7 +911,9 @@ class Neighbors:
 
         neighbours = []
         for index, geom in tqdm(
-            gdf.set_index(unique_id).geometry.iteritems(), total=gdf.shape[0]
+            gdf.set_index(unique_id).geometry.iteritems(),
+            total=gdf.shape[0],
+            disable=not verbose,
         ):
             if index in spatial_weights.neighbors.keys():
                 if weighted is True:
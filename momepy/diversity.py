@@ -6,7 +6,6 @@
 
 import numpy as np
 import pandas as pd
-import scipy as sp
 from tqdm import tqdm  # progress bar
 
 __all__ = ["Range", "Theil", "Simpson", "Gini", "Shannon", "Unique"]
@@ -33,6 +32,8 @@ class Range:
     rng : Two-element sequence containing floats in range of [0,100], optional
         Percentiles over which to compute the range. Each must be
         between 0 and 100, inclusive. The order of the elements is not important.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
     **kwargs : keyword arguments
         optional arguments for ``scipy.stats.iqr``
 
@@ -62,7 +63,18 @@ class Range:
 
     """
 
-    def __init__(self, gdf, values, spatial_weights, unique_id, rng=(0, 100), **kwargs):
+    def __init__(
+        self,
+        gdf,
+        values,
+        spatial_weights,
+        unique_id,
+        rng=(0, 100),
+        verbose=True,
+        **kwargs
+    ):
+        from scipy import stats
+
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
@@ -79,7 +91,7 @@ class Range:
         data = data.set_index(unique_id)[values]
 
         results_list = []
-        for index in tqdm(data.index, total=data.shape[0]):
+        for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
@@ -88,7 +100,7 @@ class Range:
                     neighbours = [index]
 
                 values_list = data.loc[neighbours]
-                results_list.append(sp.stats.iqr(values_list, rng=rng, **kwargs))
+                results_list.append(stats.iqr(values_list, rng=rng, **kwargs))
             else:
                 results_list.append(np.nan)
 
@@ -118,6 +130,8 @@ class Theil:
     rng : Two-element sequence containing floats in range of [0,100], optional
         Percentiles over which to compute the range. Each must be
         between 0 and 100, inclusive. The order of the elements is not important.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -141,7 +155,7 @@ class Theil:
     100%|██████████| 144/144 [00:00<00:00, 597.37it/s]
     """
 
-    def __init__(self, gdf, values, spatial_weights, unique_id, rng=None):
+    def __init__(self, gdf, values, spatial_weights, unique_id, rng=None, verbose=True):
         try:
             from inequality.theil import Theil
         except ImportError:
@@ -165,7 +179,7 @@ class Theil:
             from momepy import limit_range
 
         results_list = []
-        for index in tqdm(data.index, total=data.shape[0]):
+        for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
@@ -222,6 +236,8 @@ class Simpson:
         treat values as categories (will not use ``binning``)
     categories : list-like (default None)
         list of categories. If None ``values.unique()`` is used.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
     **classification_kwds : dict
         Keyword arguments for classification scheme
         For details see `mapclassify documentation <https://pysal.org/mapclassify>`_.
@@ -263,6 +279,7 @@ class Simpson:
         inverse=False,
         categorical=False,
         categories=None,
+        verbose=True,
         **classification_kwds
     ):
         if not categorical:
@@ -307,7 +324,7 @@ class Simpson:
             categories = data.unique()
 
         results_list = []
-        for index in tqdm(data.index, total=data.shape[0]):
+        for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
@@ -378,6 +395,8 @@ class Gini:
     rng : Two-element sequence containing floats in range of [0,100], optional
         Percentiles over which to compute the range. Each must be
         between 0 and 100, inclusive. The order of the elements is not important.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -401,7 +420,7 @@ class Gini:
     100%|██████████| 144/144 [00:00<00:00, 597.37it/s]
     """
 
-    def __init__(self, gdf, values, spatial_weights, unique_id, rng=None):
+    def __init__(self, gdf, values, spatial_weights, unique_id, rng=None, verbose=True):
         try:
             from inequality.gini import Gini
         except ImportError:
@@ -431,7 +450,7 @@ class Gini:
             from momepy import limit_range
 
         results_list = []
-        for index in tqdm(data.index, total=data.shape[0]):
+        for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
@@ -482,6 +501,8 @@ class Shannon:
         treat values as categories (will not use binning)
     categories : list-like (default None)
         list of categories. If None values.unique() is used.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
     **classification_kwds : dict
         Keyword arguments for classification scheme
         For details see `mapclassify documentation <https://pysal.org/mapclassify>`_.
@@ -521,6 +542,7 @@ class Shannon:
         binning="HeadTailBreaks",
         categorical=False,
         categories=None,
+        verbose=True,
         **classification_kwds
     ):
         if not categorical:
@@ -563,7 +585,7 @@ class Shannon:
             categories = data.unique()
 
         results_list = []
-        for index in tqdm(data.index, total=data.shape[0]):
+        for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
@@ -626,6 +648,8 @@ class Unique:
         spatial weights matrix
     unique_id : str
         name of the column with unique id used as ``spatial_weights`` index
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -649,7 +673,7 @@ class Unique:
 
     """
 
-    def __init__(self, gdf, values, spatial_weights, unique_id):
+    def __init__(self, gdf, values, spatial_weights, unique_id, verbose=True):
         self.gdf = gdf
         self.sw = spatial_weights
         self.id = gdf[unique_id]
@@ -664,7 +688,7 @@ class Unique:
         data = data.set_index(unique_id)[values]
 
         results_list = []
-        for index in tqdm(data.index, total=data.shape[0]):
+        for index in tqdm(data.index, total=data.shape[0], disable=not verbose):
             if index in spatial_weights.neighbors.keys():
                 neighbours = spatial_weights.neighbors[index].copy()
                 if neighbours:
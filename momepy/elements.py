@@ -9,8 +9,6 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 import shapely
-import libpysal
-from scipy.spatial import Voronoi
 from shapely.geometry import MultiPolygon, Point, Polygon
 from shapely.wkt import loads
 from tqdm import tqdm
@@ -81,6 +79,8 @@ class Tessellation:
         distance for negative buffer to generate space between adjacent polygons (if geometry type of gdf is (Multi)Polygon).
     segment : float (default 0.5)
         maximum distance between points after discretization
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -132,7 +132,7 @@ class Tessellation:
     queen_corners is currently experimental method only and can cause errors.
     """
 
-    def __init__(self, gdf, unique_id, limit, shrink=0.4, segment=0.5):
+    def __init__(self, gdf, unique_id, limit, shrink=0.4, segment=0.5, verbose=True):
         self.gdf = gdf
         self.id = gdf[unique_id]
         self.limit = limit
@@ -146,8 +146,11 @@ class Tessellation:
             xoff=-centre[0], yoff=-centre[1]
         )
 
+        self.verbose = verbose
+
         polys = ["Polygon", "MultiPolygon"]
-        print("Inward offset...")
+        if verbose:
+            print("Inward offset...")
         objects["geometry"] = objects.geometry.apply(
             lambda g: g.buffer(-shrink, cap_style=2, join_style=2)
             if g.type in polys
@@ -157,11 +160,13 @@ class Tessellation:
         objects = objects.explode()
         objects.reset_index(inplace=True, drop=True)
 
-        print("Discretization...")
+        if verbose:
+            print("Discretization...")
         objects["geometry"] = objects["geometry"].apply(self._densify, segment=segment)
 
-        print("Generating input point array...")
-        points, ids = self._point_array(objects, unique_id)
+        if verbose:
+            print("Generating input point array...")
+        points, ids = self._point_array(objects, unique_id, verbose=verbose)
 
         # add convex hull buffered large distance to eliminate infinity issues
         series = gpd.GeoSeries(limit, crs=gdf.crs).translate(
@@ -174,13 +179,20 @@ class Tessellation:
             points.append(hull_array[i])
             ids.append(-1)
 
-        print("Generating Voronoi diagram...")
+        from scipy.spatial import Voronoi
+
+        if verbose:
+            print("Generating Voronoi diagram...")
         voronoi_diagram = Voronoi(np.array(points))
 
-        print("Generating GeoDataFrame...")
-        regions_gdf = self._regions(voronoi_diagram, unique_id, ids, crs=gdf.crs)
+        if verbose:
+            print("Generating GeoDataFrame...")
+        regions_gdf = self._regions(
+            voronoi_diagram, unique_id, ids, crs=gdf.crs, verbose=verbose
+        )
 
-        print("Dissolving Voronoi polygons...")
+        if verbose:
+            print("Dissolving Voronoi polygons...")
         morphological_tessellation = regions_gdf[[unique_id, "geometry"]].dissolve(
             by=unique_id, as_index=False
         )
@@ -190,7 +202,7 @@ class Tessellation:
         ].translate(xoff=centre[0], yoff=centre[1])
 
         morphological_tessellation, sindex = self._cut(
-            morphological_tessellation, limit, unique_id
+            morphological_tessellation, limit, unique_id, verbose=verbose
         )
         self.sindex = sindex
 
@@ -217,11 +229,14 @@ class Tessellation:
         changes = {}
         qid = 0
 
-        for ix, row in tqdm(tessellation.iterrows(), total=tessellation.shape[0]):
+        for cell in tqdm(
+            tessellation.geometry,
+            total=tessellation.shape[0],
+            disable=not self.verbose,
+        ):
             corners = []
             change = []
 
-            cell = row.geometry
             coords = cell.exterior.coords
             for i in coords:
                 point = Point(i)
@@ -252,8 +267,11 @@ class Tessellation:
                     changes[(points[1].x, points[1].y)] = new
                     qid = qid + 1
 
-        for ix, row in tqdm(tessellation.iterrows(), total=tessellation.shape[0]):
-            cell = row.geometry
+        for ix, cell in tqdm(
+            tessellation.geometry.iteritems(),
+            total=tessellation.shape[0],
+            disable=not self.verbose,
+        ):
             coords = list(cell.exterior.coords)
 
             moves = {}
@@ -329,17 +347,21 @@ class Tessellation:
         except Exception:
             return poly
 
-    def _point_array(self, objects, unique_id):
+    def _point_array(self, objects, unique_id, verbose=True):
         """
         Returns lists of points and ids based on geometry and unique_id.
         """
         points = []
         ids = []
-        for idx, row in tqdm(objects.iterrows(), total=objects.shape[0]):
-            if row["geometry"].type in ["Polygon", "MultiPolygon"]:
-                poly_ext = row["geometry"].boundary
+        for uid, geometry in tqdm(
+            objects[[unique_id, "geometry"]].itertuples(index=False, name=None),
+            total=objects.shape[0],
+            disable=not verbose,
+        ):
+            if geometry.type in ["Polygon", "MultiPolygon"]:
+                poly_ext = geometry.boundary
             else:
-                poly_ext = row["geometry"]
+                poly_ext = geometry
             if poly_ext is not None:
                 if poly_ext.type == "MultiLineString":
                     for line in poly_ext:
@@ -347,18 +369,18 @@ class Tessellation:
                         row_array = np.array(point_coords[:-1]).tolist()
                         for i, a in enumerate(row_array):
                             points.append(row_array[i])
-                            ids.append(row[unique_id])
+                            ids.append(uid)
                 elif poly_ext.type == "LineString":
                     point_coords = poly_ext.coords
                     row_array = np.array(point_coords[:-1]).tolist()
                     for i, a in enumerate(row_array):
                         points.append(row_array[i])
-                        ids.append(row[unique_id])
+                        ids.append(uid)
                 else:
                     raise Exception("Boundary type is {}".format(poly_ext.type))
         return points, ids
 
-    def _regions(self, voronoi_diagram, unique_id, ids, crs):
+    def _regions(self, voronoi_diagram, unique_id, ids, crs, verbose=True):
         """
         Generate GeoDataFrame of Voronoi regions from scipy.spatial.Voronoi.
         """
@@ -375,7 +397,9 @@ class Tessellation:
 
         # convert vertices to Polygons
         polygons = []
-        for region in tqdm(regions.vertices, desc="Vertices to Polygons"):
+        for region in tqdm(
+            regions.vertices, desc="Vertices to Polygons", disable=not verbose
+        ):
             if -1 not in region:
                 polygons.append(Polygon(voronoi_diagram.vertices[region]))
             else:
@@ -394,21 +418,24 @@ class Tessellation:
         regions_gdf.crs = crs
         return regions_gdf
 
-    def _cut(self, tessellation, limit, unique_id):
+    def _cut(self, tessellation, limit, unique_id, verbose=True):
         """
         Cut tessellation by the limit (Multi)Polygon.
 
         ADD: add option to delete everything outside of limit. Now it keeps it.
         """
-        print("Preparing limit for edge resolving...")
+        if verbose:
+            print("Preparing limit for edge resolving...")
         geometry_cut = _split_lines(limit, 100)
 
-        print("Building R-tree...")
+        if verbose:
+            print("Building R-tree...")
         sindex = tessellation.sindex
         # find the points that intersect with each subpolygon and add them to points_within_geometry
-        print("Identifying edge cells...")
+        if verbose:
+            print("Identifying edge cells...")
         to_cut = pd.DataFrame()
-        for poly in tqdm(geometry_cut, total=(len(geometry_cut))):
+        for poly in tqdm(geometry_cut, total=(len(geometry_cut)), disable=not verbose):
             # find approximate matches with r-tree, then precise matches from those approximate ones
             possible_matches_index = list(sindex.intersection(poly.bounds))
             possible_matches = tessellation.iloc[possible_matches_index]
@@ -419,10 +446,12 @@ class Tessellation:
         to_cut = to_cut.drop_duplicates(subset=[unique_id])
         subselection = list(to_cut.index)
 
-        print("Cutting...")
+        if verbose:
+            print("Cutting...")
         for idx, rgeom in tqdm(
             tessellation.loc[subselection].geometry.iteritems(),
             total=tessellation.loc[subselection].shape[0],
+            disable=not verbose,
         ):
             intersection = rgeom.intersection(limit)
             if intersection.type == "MultiPolygon":
@@ -493,6 +522,8 @@ class Blocks:
     unique_id : str
         name of the column with unique id. If there is none, it could be generated by :func:`momepy.unique_id`.
         This should be the same for cells and buildings, id's should match.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -539,7 +570,9 @@ class Blocks:
 
     """
 
-    def __init__(self, tessellation, edges, buildings, id_name, unique_id):
+    def __init__(
+        self, tessellation, edges, buildings, id_name, unique_id, verbose=True
+    ):
         self.tessellation = tessellation
         self.edges = edges
         self.buildings = buildings
@@ -553,34 +586,42 @@ class Blocks:
 
         cells_copy = tessellation[[unique_id, "geometry"]].copy()
 
-        print("Buffering streets...")
+        if verbose:
+            print("Buffering streets...")
         street_buff = edges.copy()
         street_buff["geometry"] = street_buff.buffer(0.1)
 
-        print("Generating spatial index...")
+        if verbose:
+            print("Generating spatial index...")
         streets_index = street_buff.sindex
 
-        print("Difference...")
+        if verbose:
+            print("Difference...")
         new_geom = []
 
         for ix, cell in tqdm(
-            cells_copy.geometry.iteritems(), total=cells_copy.shape[0]
+            cells_copy.geometry.iteritems(),
+            total=cells_copy.shape[0],
+            disable=not verbose,
         ):
             possible_matches_index = list(streets_index.intersection(cell.bounds))
             possible_matches = street_buff.iloc[possible_matches_index]
             new_geom.append(cell.difference(possible_matches.geometry.unary_union))
 
-        print("Defining adjacency...")
+        if verbose:
+            print("Defining adjacency...")
         blocks_gdf = gpd.GeoDataFrame(geometry=gpd.GeoSeries(new_geom))
         blocks_gdf = blocks_gdf.explode().reset_index(drop=True)
 
-        spatial_weights = libpysal.weights.Queen.from_dataframe(
-            blocks_gdf, silence_warnings=True
-        )
+        from libpysal.weights import Queen
+
+        spatial_weights = Queen.from_dataframe(blocks_gdf, silence_warnings=True)
 
         patches = {}
         jID = 1
-        for idx in tqdm(blocks_gdf.index, total=blocks_gdf.shape[0]):
+        for idx in tqdm(
+            blocks_gdf.index, total=blocks_gdf.shape[0], disable=not verbose
+        ):
 
             # if the id is already present in courtyards, continue (avoid repetition)
             if idx in patches:
@@ -610,33 +651,40 @@ class Blocks:
 
         blocks_gdf["patch"] = blocks_gdf.index.map(patches)
 
-        print("Defining street-based blocks...")
+        if verbose:
+            print("Defining street-based blocks...")
         blocks_single = blocks_gdf.dissolve(by="patch")
         blocks_single.crs = buildings.crs
 
         blocks_single["geometry"] = blocks_single.buffer(0.1)
 
-        print("Defining block ID...")  # street based
+        if verbose:
+            print("Defining block ID...")  # street based
         blocks_single[id_name] = range(len(blocks_single))
 
-        print("Generating centroids...")
+        if verbose:
+            print("Generating centroids...")
         buildings_c = buildings.copy()
         buildings_c["geometry"] = buildings_c.representative_point()  # make points
 
-        print("Spatial join...")
+        if verbose:
+            print("Spatial join...")
         centroids_tempID = gpd.sjoin(
             buildings_c, blocks_single, how="left", op="intersects"
         )
 
         tempID_to_uID = centroids_tempID[[unique_id, id_name]]
 
-        print("Attribute join (tesselation)...")
+        if verbose:
+            print("Attribute join (tesselation)...")
         cells_copy = cells_copy.merge(tempID_to_uID, on=unique_id, how="left")
 
-        print("Generating blocks...")
+        if verbose:
+            print("Generating blocks...")
         blocks = cells_copy.dissolve(by=id_name)
 
-        print("Multipart to singlepart...")
+        if verbose:
+            print("Multipart to singlepart...")
         blocks = blocks.explode()
         blocks.reset_index(inplace=True, drop=True)
 
@@ -647,7 +695,9 @@ class Blocks:
 
         # if polygon is within another one, delete it
         sindex = blocks.sindex
-        for idx, geom in tqdm(blocks.geometry.iteritems(), total=blocks.shape[0]):
+        for idx, geom in tqdm(
+            blocks.geometry.iteritems(), total=blocks.shape[0], disable=not verbose
+        ):
             possible_matches = list(sindex.intersection(geom.bounds))
             possible_matches.remove(idx)
             possible = blocks.iloc[possible_matches]
@@ -666,20 +716,22 @@ class Blocks:
         )
         bl_ID_to_uID = centroids_w_bl_ID2[[unique_id, id_name]]
 
-        print("Attribute join (buildings)...")
+        if verbose:
+            print("Attribute join (buildings)...")
         buildings_m = buildings[[unique_id]].merge(
             bl_ID_to_uID, on=unique_id, how="left"
         )
         self.buildings_id = buildings_m[id_name]
 
-        print("Attribute join (tesselation)...")
+        if verbose:
+            print("Attribute join (tesselation)...")
         cells_m = tessellation[[unique_id]].merge(
             bl_ID_to_uID, on=unique_id, how="left"
         )
         self.tessellation_id = cells_m[id_name]
 
 
-def get_network_id(left, right, network_id, min_size=100):
+def get_network_id(left, right, network_id, min_size=100, verbose=True):
     """
     Snap each element (preferably building) to the closest street network segment, saves its id.
 
@@ -698,6 +750,8 @@ def get_network_id(left, right, network_id, min_size=100):
         min_size should be a vaule such that if you build a box centered in each
         building centroid with edges of size ``2*min_size``, you know a priori that at least one
         segment is intersected with the box.
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Returns
     -------
@@ -726,16 +780,23 @@ def get_network_id(left, right, network_id, min_size=100):
         right["mm_nid"] = network_id
         network_id = "mm_nid"
 
-    print("Generating centroids...")
+    if verbose:
+        print("Generating centroids...")
     buildings_c = left.copy()
 
     buildings_c["geometry"] = buildings_c.centroid  # make centroids
 
-    print("Generating rtree...")
+    if verbose:
+        print("Generating rtree...")
     idx = right.sindex
 
     result = []
-    for p in tqdm(buildings_c.geometry, total=buildings_c.shape[0], desc="Snapping"):
+    for p in tqdm(
+        buildings_c.geometry,
+        total=buildings_c.shape[0],
+        desc="Snapping",
+        disable=not verbose,
+    ):
         pbox = (p.x - MIN_SIZE, p.y - MIN_SIZE, p.x + MIN_SIZE, p.y + MIN_SIZE)
         hits = list(idx.intersection(pbox))
         d = INFTY
@@ -762,7 +823,7 @@ def get_network_id(left, right, network_id, min_size=100):
     return series
 
 
-def get_node_id(objects, nodes, edges, node_id, edge_id):
+def get_node_id(objects, nodes, edges, node_id, edge_id, verbose=True):
     """
     Snap each building to closest street network node on the closest network edge.
 
@@ -781,6 +842,8 @@ def get_node_id(objects, nodes, edges, node_id, edge_id):
         and end points of each segment. Start and endpoints are default outcome of :func:`momepy.nx_to_gdf`.
     node_id : str, list, np.array, pd.Series (default None)
         the name of the nodes dataframe column, ``np.array``, or ``pd.Series`` with unique id
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Returns
     -------
@@ -797,6 +860,7 @@ def get_node_id(objects, nodes, edges, node_id, edge_id):
     for row in tqdm(
         objects[[edge_id, objects._geometry_column_name]].itertuples(),
         total=objects.shape[0],
+        disable=not verbose,
     ):
         if np.isnan(row[1]):
 
@@ -386,6 +386,19 @@ def _cross_product(x0, y0, x1, y1, x2, y2):
 # end of Nayuiki script to define the smallest enclosing circle
 
 
+# calculate angles of all vertices of a closed ring at once
+def _angles(points):
+    a = points[:-1]
+    b = points[1:]
+    c = np.append(points[2:], points[1:2], axis=0)
+    ba = a - b
+    bc = c - b
+    cosine_angle = (ba * bc).sum(axis=1) / (
+        np.linalg.norm(ba, axis=1) * np.linalg.norm(bc, axis=1)
+    )
+    return np.degrees(np.arccos(cosine_angle))
+
+
 # calculate the area of circumcircle
 def _circle_area(points):
     if len(points[0]) == 3:
@@ -431,17 +444,19 @@ class CircularCompactness:
     def __init__(self, gdf, areas=None):
         self.gdf = gdf
 
-        gdf = gdf.copy()
-
         if areas is None:
             areas = gdf.geometry.area
-        if not isinstance(areas, str):
-            gdf["mm_a"] = areas
-            areas = "mm_a"
-        self.areas = gdf[areas]
-        gdf["hull"] = gdf.convex_hull.exterior
-        self.series = gdf[[areas, "hull"]].apply(
-            lambda row: (row[areas]) / (_circle_area(list(row.hull.coords))), axis=1
+        elif isinstance(areas, str):
+            areas = gdf[areas]
+        else:
+            areas = pd.Series(areas, index=gdf.index)
+        self.areas = areas
+
+        # compute the hulls once and reuse their ring coordinates
+        hulls = gdf.geometry.convex_hull.exterior
+        self.series = self.areas / pd.Series(
+            [_circle_area(np.asarray(hull.coords)) for hull in hulls.values],
+            index=gdf.index,
         )
 
 
@@ -732,6 +747,8 @@ class Corners:
     ----------
     gdf : GeoDataFrame
         GeoDataFrame containing objects
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -751,57 +768,18 @@ class Corners:
 
     """
 
-    def __init__(self, gdf):
+    def __init__(self, gdf, verbose=True):
         self.gdf = gdf
 
         # define empty list for results
         results_list = []
 
-        # calculate angle between points, return true or false if real corner
-        def _true_angle(a, b, c):
-            ba = a - b
-            bc = c - b
-
-            cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-            angle = np.arccos(cosine_angle)
-
-            if np.degrees(angle) <= 170:
-                return True
-            if np.degrees(angle) >= 190:
-                return True
-            return False
-
-        # fill new column with the value of area, iterating over rows one by one
-        for geom in tqdm(gdf.geometry, total=gdf.shape[0]):
-            corners = 0  # define empty variables
-            points = list(geom.exterior.coords)  # get points of a shape
-            stop = len(points) - 1  # define where to stop
-            for i in np.arange(
-                len(points)
-            ):  # for every point, calculate angle and add 1 if True angle
-                if i == 0:
-                    continue
-                elif i == stop:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[1])
-
-                    if _true_angle(a, b, c) is True:
-                        corners = corners + 1
-                    else:
-                        continue
-
-                else:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[i + 1])
-
-                    if _true_angle(a, b, c) is True:
-                        corners = corners + 1
-                    else:
-                        continue
-
-            results_list.append(corners)
+        # calculate angles of all points of a shape at once and count true corners
+        for geom in tqdm(gdf.geometry.values, total=gdf.shape[0], disable=not verbose):
+            points = np.asarray(geom.exterior.coords)  # get points of a shape
+            angles = _angles(points)
+            # angle is a corner if it deviates from a straight line
+            results_list.append(np.count_nonzero((angles <= 170) | (angles >= 190)))
 
         self.series = pd.Series(results_list, index=gdf.index)
 
@@ -823,6 +801,8 @@ class Squareness:
     ----------
     gdf : GeoDataFrame
         GeoDataFrame containing objects
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -839,57 +819,16 @@ class Squareness:
     3.7075816043359864
     """
 
-    def __init__(self, gdf):
+    def __init__(self, gdf, verbose=True):
         self.gdf = gdf
         # define empty list for results
         results_list = []
 
-        def _angle(a, b, c):
-            ba = a - b
-            bc = c - b
-
-            cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-            angle = np.degrees(np.arccos(cosine_angle))
-
-            return angle
-
-        # fill new column with the value of area, iterating over rows one by one
-        for geom in tqdm(gdf.geometry, total=gdf.shape[0]):
-            angles = []
-            points = list(geom.exterior.coords)  # get points of a shape
-            stop = len(points) - 1  # define where to stop
-            for i in np.arange(
-                len(points)
-            ):  # for every point, calculate angle and add 1 if True angle
-                if i == 0:
-                    continue
-                elif i == stop:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[1])
-                    ang = _angle(a, b, c)
-
-                    if ang <= 175:
-                        angles.append(ang)
-                    elif _angle(a, b, c) >= 185:
-                        angles.append(ang)
-                    else:
-                        continue
-
-                else:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[i + 1])
-                    ang = _angle(a, b, c)
-
-                    if _angle(a, b, c) <= 175:
-                        angles.append(ang)
-                    elif _angle(a, b, c) >= 185:
-                        angles.append(ang)
-                    else:
-                        continue
-            deviations = [abs(90 - i) for i in angles]
-            results_list.append(np.mean(deviations))
+        # calculate angles of all points of a shape at once, keep true corners only
+        for geom in tqdm(gdf.geometry.values, total=gdf.shape[0], disable=not verbose):
+            angles = _angles(np.asarray(geom.exterior.coords))
+            angles = angles[(angles <= 175) | (angles >= 185)]
+            results_list.append(np.mean(np.abs(90 - angles)))
 
         self.series = pd.Series(results_list, index=gdf.index)
 
@@ -1030,6 +969,8 @@ class CentroidCorners:
     ----------
     gdf : GeoDataFrame
         GeoDataFrame containing objects
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -1052,76 +993,32 @@ class CentroidCorners:
     3.0810634305400177
     """
 
-    def __init__(self, gdf):
+    def __init__(self, gdf, verbose=True):
         self.gdf = gdf
         # define empty list for results
         results_list = []
         results_list_sd = []
 
-        # calculate angle between points, return true or false if real corner
-        def true_angle(a, b, c):
-            ba = a - b
-            bc = c - b
-
-            cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-            angle = np.arccos(cosine_angle)
-
-            if np.degrees(angle) <= 170:
-                return True
-            if np.degrees(angle) >= 190:
-                return True
-            return False
-
         # iterating over rows one by one
-        for geom in tqdm(gdf.geometry, total=gdf.shape[0]):
-            distances = []  # set empty list of distances
-            centroid = geom.centroid  # define centroid
-            points = list(geom.exterior.coords)  # get points of a shape
-            stop = len(points) - 1  # define where to stop
-            for i in np.arange(
-                len(points)
-            ):  # for every point, calculate angle and add 1 if True angle
-                if i == 0:
-                    continue
-                elif i == stop:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[1])
-                    p = Point(points[i])
-
-                    if true_angle(a, b, c) is True:
-                        distance = centroid.distance(
-                            p
-                        )  # calculate distance point - centroid
-                        distances.append(distance)  # add distance to the list
-                    else:
-                        continue
-
-                else:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[i + 1])
-                    p = Point(points[i])
-
-                    if true_angle(a, b, c) is True:
-                        distance = centroid.distance(p)
-                        distances.append(distance)
-                    else:
-                        continue
-            if not distances:  # circular buildings
+        for geom in tqdm(gdf.geometry.values, total=gdf.shape[0], disable=not verbose):
+            points = np.asarray(geom.exterior.coords)  # get points of a shape
+            # angle at each vertex; a real corner is under 170 or over 190 degrees
+            angles = _angles(points)
+            corners = points[1:][(angles <= 170) | (angles >= 190)]
+
+            if corners.shape[0]:
+                centroid = geom.centroid  # define centroid
+                distances = np.hypot(  # distance point - centroid
+                    corners[:, 0] - centroid.x, corners[:, 1] - centroid.y
+                )
+                results_list.append(np.mean(distances))  # calculate mean
+                results_list_sd.append(np.std(distances))  # calculate st.dev
+            else:  # circular buildings
                 from momepy.dimension import _longest_axis
 
-                if geom.has_z:
-                    coords = [
-                        (coo[0], coo[1]) for coo in geom.convex_hull.exterior.coords
-                    ]
-                else:
-                    coords = geom.convex_hull.exterior.coords
+                coords = np.asarray(geom.convex_hull.exterior.coords)[:, :2]
                 results_list.append(_longest_axis(coords) / 2)
                 results_list_sd.append(0)
-            else:
-                results_list.append(np.mean(distances))  # calculate mean
-                results_list_sd.append(np.std(distances))  # calculate st.dev
         self.mean = pd.Series(results_list, index=gdf.index)
         self.std = pd.Series(results_list_sd, index=gdf.index)
 
@@ -1141,6 +1038,8 @@ class Linearity:
     ----------
     gdf : GeoDataFrame
         GeoDataFrame containing objects
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -1157,7 +1056,7 @@ class Linearity:
     1.0
     """
 
-    def __init__(self, gdf):
+    def __init__(self, gdf, verbose=True):
         self.gdf = gdf
         # define empty list for results
         results_list = []
@@ -1165,9 +1064,13 @@ class Linearity:
         lenghts = gdf.geometry.length
         # fill new column with the value of area, iterating over rows one by one
         # TODO use math instead of shapely points
-        for index, geom in tqdm(gdf.geometry.iteritems(), total=gdf.shape[0]):
+        for geom, length in tqdm(
+            zip(gdf.geometry.values, lenghts.values),
+            total=gdf.shape[0],
+            disable=not verbose,
+        ):
             euclidean = Point(geom.coords[0]).distance(Point(geom.coords[-1]))
-            results_list.append(euclidean / lenghts.loc[index])
+            results_list.append(euclidean / length)
 
         self.series = pd.Series(results_list, index=gdf.index)
 
@@ -5,7 +5,6 @@ import math
 import operator
 
 import geopandas as gpd
-import libpysal
 import networkx as nx
 import numpy as np
 import pandas as pd
@@ -69,12 +68,11 @@ def _generate_primal(G, gdf_network, fields):
     """
     G.graph["approach"] = "primal"
     key = 0
-    for index, row in gdf_network.iterrows():
-        first = row.geometry.coords[0]
-        last = row.geometry.coords[-1]
+    for row in gdf_network[fields].itertuples(index=False, name=None):
+        attributes = dict(zip(fields, row))
+        first = attributes["geometry"].coords[0]
+        last = attributes["geometry"].coords[-1]
 
-        data = [row[f] for f in fields]
-        attributes = dict(zip(fields, data))
         G.add_edge(first, last, key=key, **attributes)
         key += 1
 
@@ -84,22 +82,25 @@ def _generate_dual(G, gdf_network, fields):
     Generate dual graph
     Helper for gdf_to_nx.
     """
+    from libpysal.weights import Queen
+
     G.graph["approach"] = "dual"
-    sw = libpysal.weights.Queen.from_dataframe(gdf_network)
+    sw = Queen.from_dataframe(gdf_network)
     gdf_network["mm_cent"] = gdf_network.geometry.centroid
 
-    for i, (index, row) in enumerate(gdf_network.iterrows()):
-        centroid = (row.mm_cent.x, row.mm_cent.y)
-        data = [row[f] for f in fields]
-        attributes = dict(zip(fields, data))
+    centroids = gdf_network["mm_cent"]
+    for i, row in enumerate(gdf_network[fields].itertuples(index=False, name=None)):
+        attributes = dict(zip(fields, row))
+        geom = attributes["geometry"]
+        centroid = (centroids.iloc[i].x, centroids.iloc[i].y)
         G.add_node(centroid, **attributes)
 
         if sw.cardinalities[i] > 0:
             for n in sw.neighbors[i]:
                 start = centroid
                 end = list(gdf_network.iloc[n]["mm_cent"].coords)[0]
-                p0 = row.geometry.coords[0]
-                p1 = row.geometry.coords[-1]
+                p0 = geom.coords[0]
+                p1 = geom.coords[-1]
                 p2 = gdf_network.iloc[n]["geometry"].coords[0]
                 p3 = gdf_network.iloc[n]["geometry"].coords[-1]
                 points = [p0, p1, p2, p3]
@@ -200,6 +201,8 @@ def _primal_to_gdf(net, points, lines, spatial_weights, nodeID):
         gdf_nodes = _points_to_gdf(net, spatial_weights)
 
         if spatial_weights is True:
+            import libpysal
+
             W = libpysal.weights.W.from_networkx(net)
             W.transform = "b"
 
@@ -304,7 +307,9 @@ def limit_range(vals, rng):
     return vals
 
 
-def preprocess(buildings, size=30, compactness=0.2, islands=True, loops=2):
+def preprocess(
+    buildings, size=30, compactness=0.2, islands=True, loops=2, verbose=True
+):
     """
     Preprocesses building geometry to eliminate additional structures being single features.
 
@@ -338,20 +343,25 @@ def preprocess(buildings, size=30, compactness=0.2, islands=True, loops=2):
         other structures (share 100% of exterior boundary).
     loops : int (default 2)
         number of loops
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Returns
     -------
     GeoDataFrame
         GeoDataFrame containing preprocessed geometry
     """
+    from libpysal.weights import Rook
+
     blg = buildings.copy()
     blg = blg.explode()
     blg.reset_index(drop=True, inplace=True)
     for loop in range(0, loops):
-        print("Loop", loop + 1, f"out of {loops}.")
+        if verbose:
+            print("Loop", loop + 1, f"out of {loops}.")
         blg.reset_index(inplace=True, drop=True)
         blg["mm_uid"] = range(len(blg))
-        sw = libpysal.weights.contiguity.Rook.from_dataframe(blg, silence_warnings=True)
+        sw = Rook.from_dataframe(blg, silence_warnings=True)
         blg["neighbors"] = sw.neighbors
         blg["neighbors"] = blg["neighbors"].map(sw.neighbors)
         blg["n_count"] = blg.apply(lambda row: len(row.neighbors), axis=1)
@@ -362,7 +372,10 @@ def preprocess(buildings, size=30, compactness=0.2, islands=True, loops=2):
         delete = []
 
         for row in tqdm(
-            blg.itertuples(), total=blg.shape[0], desc="Identifying changes"
+            blg.itertuples(),
+            total=blg.shape[0],
+            desc="Identifying changes",
+            disable=not verbose,
         ):
             if size:
                 if row.geometry.area < size:
@@ -430,7 +443,9 @@ def preprocess(buildings, size=30, compactness=0.2, islands=True, loops=2):
                         else:
                             join[uid] = [row.mm_uid]
 
-        for key in tqdm(join, total=len(join), desc="Changing geometry"):
+        for key in tqdm(
+            join, total=len(join), desc="Changing geometry", disable=not verbose
+        ):
             selection = blg[blg["mm_uid"] == key]
             if not selection.empty:
                 geoms = [selection.iloc[0].geometry]
@@ -447,7 +462,7 @@ def preprocess(buildings, size=30, compactness=0.2, islands=True, loops=2):
     return blg[buildings.columns]
 
 
-def network_false_nodes(gdf, tolerance=0.1, precision=3):
+def network_false_nodes(gdf, tolerance=0.1, precision=3, verbose=True):
     """
     Check topology of street network and eliminate nodes of degree 2 by joining
     affected edges. Attributes are not preserved.
@@ -461,6 +476,8 @@ def network_false_nodes(gdf, tolerance=0.1, precision=3):
     precision : int
         rounding parameter in estimating uniqueness of two points based on their
         coordinates
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Returns
     -------
@@ -481,8 +498,11 @@ def network_false_nodes(gdf, tolerance=0.1, precision=3):
     sindex = streets.sindex
 
     false_xy = []
-    print("Identifying false points...")
-    for idx, line in tqdm(streets.iteritems(), total=streets.shape[0]):
+    if verbose:
+        print("Identifying false points...")
+    for idx, line in tqdm(
+        streets.iteritems(), total=streets.shape[0], disable=not verbose
+    ):
         l_coords = list(line.coords)
         start = Point(l_coords[0]).buffer(tolerance)
         end = Point(l_coords[-1]).buffer(tolerance)
@@ -515,8 +535,9 @@ def network_false_nodes(gdf, tolerance=0.1, precision=3):
 
     geoms = streets
 
-    print("Merging segments...")
-    for point in tqdm(false_unique):
+    if verbose:
+        print("Merging segments...")
+    for point in tqdm(false_unique, disable=not verbose):
         matches = list(geoms[geoms.intersects(point.buffer(tolerance))].index)
         idx = max(geoms.index) + 1
         try:
@@ -550,6 +571,7 @@ def snap_street_network_edge(
     tessellation=None,
     tolerance_edge=None,
     edge=None,
+    verbose=True,
 ):
     """
     Fix street network before performing :class:`momepy.Blocks`.
@@ -575,6 +597,8 @@ def snap_street_network_edge(
     edge : Polygon
         edge of area covered by morphological tessellation (same as ``limit`` in
         :py:class:`momepy.Tessellation`)
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Returns
     -------
@@ -796,24 +820,30 @@ def snap_street_network_edge(
 
     network = edges.copy()
     # generating spatial index (rtree)
-    print("Building R-tree for network...")
+    if verbose:
+        print("Building R-tree for network...")
     sindex = network.sindex
-    print("Building R-tree for buildings...")
+    if verbose:
+        print("Building R-tree for buildings...")
     bindex = buildings.sindex
 
     def _get_geometry():
         if edge is not None:
             return edge.boundary
         if tessellation is not None:
-            print("Dissolving tesselation...")
+            if verbose:
+                print("Dissolving tesselation...")
             return tessellation.geometry.unary_union.boundary
         return None
 
     geometry = _get_geometry()
 
-    print("Snapping...")
+    if verbose:
+        print("Snapping...")
     # iterating over each street segment
-    for idx, line in tqdm(network.geometry.iteritems(), total=network.shape[0]):
+    for idx, line in tqdm(
+        network.geometry.iteritems(), total=network.shape[0], disable=not verbose
+    ):
 
         l_coords = list(line.coords)
         # network_w = network.drop(idx, axis=0)['geometry']  # ensure that it wont intersect itself
@@ -900,6 +930,8 @@ class CheckTessellationInput:
         check for features which would split into Multi-type
     overlap : bool (default True)
         check for overlapping features (after negative buffer)
+    verbose : bool (default True)
+        if True, shows progress bars in loops and indication of steps
 
     Attributes
     ----------
@@ -923,7 +955,9 @@ class CheckTessellationInput:
 
     warnings.filterwarnings("ignore", "GeoSeries.isna", UserWarning)
 
-    def __init__(self, gdf, shrink=0.4, collapse=True, split=True, overlap=True):
+    def __init__(
+        self, gdf, shrink=0.4, collapse=True, split=True, overlap=True, verbose=True
+    ):
         data = gdf[~gdf.is_empty]
 
         if split:
@@ -978,8 +1012,11 @@ class CheckTessellationInput:
         else:
             overlapping_c = "NA"
 
-        print(
-            "Collapsed features  : {0}\n"
-            "Split features      : {1}\n"
-            "Overlapping features: {2}".format(collapsed, split_count, overlapping_c)
-        )
+        if verbose:
+            print(
+                "Collapsed features  : {0}\n"
+                "Split features      : {1}\n"
+                "Overlapping features: {2}".format(
+                    collapsed, split_count, overlapping_c
+                )
+            )
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import libpysal
 import numpy as np
 
 
@@ -127,6 +126,8 @@ def sw_high(k, gdf=None, weights=None, ids=None, contiguity="queen", silent=True
     85.73188602442333
 
     """
+    import libpysal
+
     if weights is not None:
         first_order = weights
     elif gdf is not None: